@@ -1,16 +1,1107 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import LineCollection
 import numpy as np
 
+import copy
 import json
+import hashlib
+import os
+import time
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
 from reportlab.lib.utils import ImageReader
 import tempfile
 
+#############################################################
+# Forward-mode automatic differentiation
+#
+# A Dual carries a value array of shape (n,) and the derivatives of that
+# value with respect to k seeded inputs, shape (n, k).  The design equations
+# below only use arithmetic, abs and sqrt, so passing Duals through
+# them yields the full Jacobian of a design batch in a single pass.
+class Dual:
+    __array_ufunc__ = None  # make numpy scalars defer to our reflected ops
+
+    def __init__(self, val, der):
+        self.val = np.asarray(val, dtype=float)
+        self.der = np.asarray(der, dtype=float)
+
+    @staticmethod
+    def lift(x):
+        return x if isinstance(x, Dual) else Dual(x, 0.0)
+
+    def __add__(self, o):
+        o = Dual.lift(o)
+        return Dual(self.val + o.val, self.der + o.der)
+
+    __radd__ = __add__
+
+    def __sub__(self, o):
+        o = Dual.lift(o)
+        return Dual(self.val - o.val, self.der - o.der)
+
+    def __rsub__(self, o):
+        return Dual.lift(o) - self
+
+    def __mul__(self, o):
+        o = Dual.lift(o)
+        return Dual(self.val * o.val, self.der * o.val[..., None] + o.der * self.val[..., None])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, o):
+        o = Dual.lift(o)
+        der = (self.der * o.val[..., None] - o.der * self.val[..., None]) / (o.val ** 2)[..., None]
+        return Dual(self.val / o.val, der)
+
+    def __rtruediv__(self, o):
+        return Dual.lift(o) / self
+
+    def __neg__(self):
+        return Dual(-self.val, -self.der)
+
+    def __pow__(self, n):
+        return Dual(self.val ** n, self.der * (n * self.val ** (n - 1))[..., None])
+
+
+def _abs(x):
+    if isinstance(x, Dual):
+        return Dual(np.abs(x.val), x.der * np.sign(x.val)[..., None])
+    return np.abs(x)
+
+
+def _sqrt(x):
+    if isinstance(x, Dual):
+        root = np.sqrt(x.val)
+        return Dual(root, x.der / (2 * root)[..., None])
+    return np.sqrt(x)
+
+#############################################################
+# Topology registry
+#
+# Every converter registers one Topology instance holding its vectorized
+# equations. design_equations() looks the topology up once per batch and
+# evaluates the shared CCM model from it, so no per-sample branching on the
+# converter type is needed anywhere. The modelled inductor is the one whose
+# triangular current is reported as inductor_current_*: the only inductor for
+# Buck/Boost/Buck-Boost/Flyback (magnetizing, primary side), the input
+# inductor for SEPIC/Ćuk and the output inductor for Forward.
+TOPOLOGIES = {}
+
+
+def register_topology(cls):
+    TOPOLOGIES[cls.name] = cls()
+    return cls
+
+
+def get_topology(conv_type):
+    try:
+        return TOPOLOGIES[conv_type]
+    except KeyError:
+        raise ValueError(f"Unknown converter type: {conv_type}")
+
+
+class Topology:
+    name = None
+    default_vout = "5"
+    isolated = False
+    # The magnetics designer sizes one single-winding inductor; topologies with
+    # a second inductor or a coupled winding set this to False
+    single_inductor = True
+    # Input current is the switch current ("pulsed") or the inductor current ("continuous")
+    input_current_shape = "pulsed"
+    # Output current is the diode current ("pulsed") or the inductor current ("filter")
+    output_current_shape = "pulsed"
+
+    def validate(self, vin, vout, eta, n):
+        # Raise ValueError for operating points the topology cannot reach;
+        # overrides check their voltage limits first and then call this
+        d = self.duty(vin, vout, eta, n)
+        if not self.feasible(d):
+            raise ValueError(f"For {self.name} converter, the required duty cycle ({d:.3f}) is not achievable; "
+                             "check the output voltage against input voltage × efficiency")
+
+    def feasible(self, d):
+        # Vectorized mask of duty cycles the topology can operate at
+        return (d > 0) & (d < 1)
+
+    def duty(self, vin, vout, eta, n):
+        raise NotImplementedError
+
+    def currents(self, d, vin, vout, iout, eta, n):
+        # (input current, modelled inductor average current)
+        raise NotImplementedError
+
+    def inductor_on_voltage(self, d, vin, vout, n):
+        # Voltage across the modelled inductor while the switch is on
+        return vin
+
+    def switch_current(self, il, il_avg, iout, n):
+        # Switch current as a linear function of the inductor current during D
+        return il
+
+    def diode_current(self, il, il_avg, iout, n):
+        # Diode current as a linear function of the inductor current during 1-D
+        return il
+
+    def stress(self, vin, vout, n):
+        # Off-state (switch, diode) voltage
+        raise NotImplementedError
+
+    def output_capacitor(self, d, iout, fsw, l, delta_il, delta_vout):
+        if self.output_current_shape == "filter":
+            return delta_il / (8 * fsw * delta_vout)
+        return iout * d / (fsw * delta_vout)
+
+    def output_ripple(self, d, iout, fsw, l, c, delta_il):
+        if self.output_current_shape == "filter":
+            return delta_il / (8 * fsw * c)
+        return iout * d / (fsw * c)
+
+    def waveforms(self, params, t):
+        # Piecewise-linear CCM waveforms at times t. params values may be
+        # arrays of shape (n, 1) to produce an (n, len(t)) batch at once.
+        period = 1 / params["fsw"]
+        phase = (t % period) / period
+        d = params["duty_cycle"]
+        ripple = abs(params["current_ripple"])
+        valley = params["inductor_current_avg"] - ripple / 2
+        on = phase < d
+        il = np.where(on, valley + ripple * phase / d, valley + ripple * (1 - phase) / (1 - d))
+        n = params.get("turns_ratio", 1)
+        return {
+            "switch": on.astype(float),
+            "inductor_current": il,
+            "switch_current": np.where(on, self.switch_current(il, params["inductor_current_avg"], params["iout"], n), 0),
+            "diode_current": np.where(on, 0, self.diode_current(il, params["inductor_current_avg"], params["iout"], n)),
+        }
+
+
+@register_topology
+class Buck(Topology):
+    name = "Buck"
+    default_vout = "5"
+    output_current_shape = "filter"
+
+    def validate(self, vin, vout, eta, n):
+        if vout >= vin:
+            raise ValueError("For Buck converter, output voltage must be less than input voltage")
+        super().validate(vin, vout, eta, n)
+
+    def duty(self, vin, vout, eta, n):
+        return vout / (vin * eta)
+
+    def currents(self, d, vin, vout, iout, eta, n):
+        return iout * vout / (vin * eta), iout
+
+    def inductor_on_voltage(self, d, vin, vout, n):
+        return vin - vout
+
+    def stress(self, vin, vout, n):
+        return vin, vin
+
+
+@register_topology
+class Boost(Topology):
+    name = "Boost"
+    default_vout = "24"
+    input_current_shape = "continuous"
+
+    def validate(self, vin, vout, eta, n):
+        if vout <= vin:
+            raise ValueError("For Boost converter, output voltage must be greater than input voltage")
+        super().validate(vin, vout, eta, n)
+
+    def duty(self, vin, vout, eta, n):
+        return 1 - (vin * eta / vout)
+
+    def currents(self, d, vin, vout, iout, eta, n):
+        iin = iout * vout / (vin * eta)
+        return iin, iin
+
+    def stress(self, vin, vout, n):
+        return vout, vout
+
+
+@register_topology
+class BuckBoost(Topology):
+    name = "Buck-Boost"
+    default_vout = "-12"
+
+    def duty(self, vin, vout, eta, n):
+        return _abs(vout) / (vin * eta + _abs(vout))
+
+    def currents(self, d, vin, vout, iout, eta, n):
+        iin = iout * _abs(vout) / (vin * eta)
+        return iin, iin / d
+
+    def stress(self, vin, vout, n):
+        return vin + _abs(vout), vin + _abs(vout)
+
+
+@register_topology
+class Sepic(Topology):
+    # Two equal, uncoupled inductors; both ramp together so the switch and
+    # diode carry i_L1 + i_L2 = 2·i_L1 - I_L1 + Iout
+    name = "SEPIC"
+    default_vout = "12"
+    single_inductor = False
+    input_current_shape = "continuous"
+
+    def validate(self, vin, vout, eta, n):
+        if vout <= 0:
+            raise ValueError("For SEPIC converter, output voltage must be positive")
+        super().validate(vin, vout, eta, n)
+
+    def duty(self, vin, vout, eta, n):
+        return vout / (vin * eta + vout)
+
+    def currents(self, d, vin, vout, iout, eta, n):
+        iin = iout * vout / (vin * eta)
+        return iin, iin
+
+    def switch_current(self, il, il_avg, iout, n):
+        return 2 * il - il_avg + iout
+
+    diode_current = switch_current
+
+    def stress(self, vin, vout, n):
+        return vin + vout, vin + vout
+
+
+@register_topology
+class Cuk(Sepic):
+    # Inverting; the output inductor L2 filters the output like a buck
+    name = "Ćuk"
+    default_vout = "-12"
+    output_current_shape = "filter"
+
+    def validate(self, vin, vout, eta, n):
+        if vout >= 0:
+            raise ValueError("For Ćuk converter, output voltage must be negative")
+        Topology.validate(self, vin, vout, eta, n)  # skip the SEPIC sign check
+
+    def duty(self, vin, vout, eta, n):
+        return _abs(vout) / (vin * eta + _abs(vout))
+
+    def currents(self, d, vin, vout, iout, eta, n):
+        iin = iout * _abs(vout) / (vin * eta)
+        return iin, iin
+
+    def stress(self, vin, vout, n):
+        return vin + _abs(vout), vin + _abs(vout)
+
+
+@register_topology
+class Flyback(Topology):
+    # L is the primary magnetizing inductance, n = Np/Ns
+    name = "Flyback"
+    default_vout = "5"
+    isolated = True
+    single_inductor = False
+
+    def validate(self, vin, vout, eta, n):
+        if vout <= 0:
+            raise ValueError("For Flyback converter, output voltage must be positive")
+        super().validate(vin, vout, eta, n)
+
+    def duty(self, vin, vout, eta, n):
+        return n * vout / (vin * eta + n * vout)
+
+    def currents(self, d, vin, vout, iout, eta, n):
+        iin = iout * vout / (vin * eta)
+        return iin, iin / d
+
+    def diode_current(self, il, il_avg, iout, n):
+        return n * il
+
+    def stress(self, vin, vout, n):
+        return vin + n * vout, vout + vin / n
+
+
+@register_topology
+class Forward(Topology):
+    # Single-switch forward with a 1:1 reset winding; L is the output inductor,
+    # n = Np/Ns, magnetizing current neglected
+    name = "Forward"
+    default_vout = "5"
+    isolated = True
+    output_current_shape = "filter"
+
+    def validate(self, vin, vout, eta, n):
+        if vout <= 0:
+            raise ValueError("For Forward converter, output voltage must be positive")
+        if not self.feasible(self.duty(vin, vout, eta, n)):
+            raise ValueError("For Forward converter, duty cycle must not exceed 0.5 (reduce the turns ratio)")
+
+    def feasible(self, d):
+        # The 1:1 reset winding needs 1 - D ≥ D to demagnetize the core
+        return (d > 0) & (d <= 0.5)
+
+    def duty(self, vin, vout, eta, n):
+        return n * vout / (vin * eta)
+
+    def currents(self, d, vin, vout, iout, eta, n):
+        return iout * vout / (vin * eta), iout
+
+    def inductor_on_voltage(self, d, vin, vout, n):
+        return vin / n - vout
+
+    def switch_current(self, il, il_avg, iout, n):
+        return il / n
+
+    def stress(self, vin, vout, n):
+        return 2 * vin, vin / n
+
+#############################################################
+# Design equations
+def _ramp_mean_square(i_start, i_end, fraction):
+    # Mean square of a current ramping linearly from i_start to i_end during
+    # the given fraction of the period and zero otherwise
+    return fraction * (i_start**2 + i_start * i_end + i_end**2) / 3
+
+
+def design_equations(conv_type, vin, vout, iout, fsw, eta, vripple_pct=None, iripple_pct=None, l=None, c=None, n=1):
+    """Evaluate the converter equations for a batch of designs.
+
+    Inputs may be scalars, numpy arrays or Duals. When l/c are None they are
+    sized from the ripple specifications, otherwise the given values are used
+    and only the resulting ripples are computed. n is the transformer turns
+    ratio Np/Ns of isolated topologies. Returns a dict keyed like
+    current_design["parameters"].
+    """
+    topology = get_topology(conv_type)
+
+    # Duty cycle and currents
+    d = topology.duty(vin, vout, eta, n)
+    iin, il_avg = topology.currents(d, vin, vout, iout, eta, n)
+    v_on = topology.inductor_on_voltage(d, vin, vout, n)
+
+    # Auto-size inductor
+    if l is None:
+        delta_il = il_avg * iripple_pct
+        l = v_on * d / (fsw * delta_il)
+
+    # Auto-size capacitor
+    if c is None:
+        delta_vout = _abs(vout) * vripple_pct
+        c = topology.output_capacitor(d, iout, fsw, l, v_on * d / (fsw * l), delta_vout)
+
+    # Actual ripples for the chosen L/C
+    delta_il_actual = v_on * d / (fsw * l)
+    delta_vout_actual = topology.output_ripple(d, iout, fsw, l, c, delta_il_actual)
+
+    # Peak currents
+    il_peak = il_avg + delta_il_actual / 2
+    il_valley = il_avg - delta_il_actual / 2
+    isw_valley = topology.switch_current(il_valley, il_avg, iout, n)
+    isw_peak = topology.switch_current(il_peak, il_avg, iout, n)
+    id_valley = topology.diode_current(il_valley, il_avg, iout, n)
+    id_peak = topology.diode_current(il_peak, il_avg, iout, n)
+
+    # RMS and average currents of the piecewise-linear CCM waveforms: the
+    # switch conducts during D, the diode during 1-D
+    il_ms = _ramp_mean_square(il_valley, il_peak, 1)
+    isw_ms = _ramp_mean_square(isw_valley, isw_peak, d)
+    id_ms = _ramp_mean_square(id_peak, id_valley, 1 - d)
+    isw_avg = d * (isw_valley + isw_peak) / 2
+    id_avg = (1 - d) * (id_valley + id_peak) / 2
+
+    # Capacitors carry the AC part of the terminal currents
+    if topology.input_current_shape == "pulsed":
+        icin_rms = _sqrt(isw_ms - isw_avg**2)
+    else:
+        icin_rms = _sqrt(il_ms - il_avg**2)
+    if topology.output_current_shape == "pulsed":
+        icout_rms = _sqrt(id_ms - id_avg**2)
+    else:
+        icout_rms = _sqrt(il_ms - il_avg**2)
+
+    # Off-state voltage stress
+    vsw, vd = topology.stress(vin, vout, n)
+
+    return {
+        "vin": vin,
+        "vout": vout,
+        "iout": iout,
+        "fsw": fsw,
+        "efficiency": eta,
+        "duty_cycle": d,
+        "inductor": l,
+        "capacitor": c,
+        "voltage_ripple": delta_vout_actual,
+        "current_ripple": delta_il_actual,
+        "input_current": iin,
+        "inductor_current_avg": il_avg,
+        "inductor_current_peak": il_peak,
+        "switch_current_peak": isw_peak,
+        "diode_current_peak": id_peak,
+        "inductor_current_rms": _sqrt(il_ms),
+        "switch_current_rms": _sqrt(isw_ms),
+        "switch_current_avg": isw_avg,
+        "diode_current_rms": _sqrt(id_ms),
+        "diode_current_avg": id_avg,
+        "input_cap_current_rms": icin_rms,
+        "output_cap_current_rms": icout_rms,
+        "switch_voltage": vsw,
+        "diode_voltage": vd,
+        "turns_ratio": n
+    }
+
+#############################################################
+# Sensitivity analysis
+SENSITIVITY_INPUTS = ("vin", "vout", "iout", "fsw", "efficiency", "inductor", "capacitor", "turns_ratio")
+
+
+def sensitivity_analysis(conv_type, vin, vout, iout, fsw, eta, l, c, n=1):
+    """Jacobian of every design output with respect to SENSITIVITY_INPUTS.
+
+    All arguments broadcast to a batch of n designs. Returns (values, jacobian)
+    where values[key] has shape (n,) and jacobian[key] has shape (n, k) with
+    columns ordered as SENSITIVITY_INPUTS.
+    """
+    args = np.broadcast_arrays(*[np.atleast_1d(np.asarray(a, dtype=float)) for a in (vin, vout, iout, fsw, eta, l, c, n)])
+    k = len(args)
+    seeds = [Dual(a, np.broadcast_to(np.eye(k)[i], a.shape + (k,))) for i, a in enumerate(args)]
+    out = design_equations(conv_type, *seeds[:5], l=seeds[5], c=seeds[6], n=seeds[7])
+    shape = args[0].shape
+    values, jacobian = {}, {}
+    for key, y in out.items():
+        y = Dual.lift(y)
+        values[key] = np.broadcast_to(y.val, shape)
+        jacobian[key] = np.broadcast_to(y.der, shape + (k,))
+    return values, jacobian
+
+
+def rank_sensitivities(conv_type, params):
+    """Ranked (output, input, dy/dx, normalized) rows for a single design.
+
+    The normalized sensitivity (x/y)·dy/dx is the % change of the output per
+    % change of the input, which makes inputs with different units comparable.
+    """
+    values, jacobian = sensitivity_analysis(
+        conv_type, params["vin"], params["vout"], params["iout"], params["fsw"],
+        params["efficiency"], params["inductor"], params["capacitor"], params.get("turns_ratio", 1))
+    x = np.array([params.get(name, 1) for name in SENSITIVITY_INPUTS], dtype=float)
+    rows = []
+    for key in values:
+        if key in SENSITIVITY_INPUTS:
+            continue
+        y = values[key][0]
+        deriv = jacobian[key][0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = deriv * x / y
+        for name, dydx, s in zip(SENSITIVITY_INPUTS, deriv, normalized):
+            if np.isfinite(s) and abs(s) > 1e-9:
+                rows.append((key, name, dydx, s))
+    rows.sort(key=lambda r: abs(r[3]), reverse=True)
+    return rows
+
+#############################################################
+# Persistent result cache
+#
+# Entries are content-addressed: the key is a SHA-256 of the canonical JSON
+# form of the inputs plus ENGINE_VERSION, so changing any input, or the
+# equations themselves, misses the cache. Files are written to a temporary
+# name and renamed into place, which keeps concurrent readers and writers in
+# other processes safe; eviction is least-recently-used by file mtime and runs
+# under a lock file so only one process trims the cache at a time.
+ENGINE_VERSION = "5"  # bump whenever the equations change results
+
+
+def _canonical(value):
+    # JSON-friendly, order-independent form; arrays are reduced to a digest
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value)
+        return {"dtype": data.dtype.str, "shape": list(data.shape), "sha256": hashlib.sha256(data.tobytes()).hexdigest()}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return repr(value)
+    return value
+
+
+def cache_key(kind, inputs):
+    payload = json.dumps({"engine": ENGINE_VERSION, "kind": kind, "inputs": _canonical(inputs)},
+                         sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory=None, max_bytes=256 * 1024 * 1024):
+        self.directory = directory or os.environ.get("DCDC_CACHE_DIR") or os.path.join(
+            os.path.expanduser("~"), ".dc_dc_converter_designer", "cache")
+        self.max_bytes = max_bytes
+        self._written = None  # bytes written since the last size check, None forces a check
+
+    def _path(self, key, ext):
+        return os.path.join(self.directory, key[:2], key + ext)
+
+    def _read(self, path, loader):
+        try:
+            value = loader(path)
+            os.utime(path)  # mark as recently used
+            return value
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write(self, path, writer):
+        tmp = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                writer(f)
+            os.replace(tmp, path)
+            tmp = None
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        finally:
+            if tmp is not None:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+        if self._written is not None:
+            self._written += size
+        if self._written is None or self._written > self.max_bytes // 20:
+            self.evict()
+
+    def get_json(self, key):
+        def load(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return self._read(self._path(key, ".json"), load)
+
+    def put_json(self, key, value):
+        self._write(self._path(key, ".json"), lambda f: f.write(json.dumps(value).encode("utf-8")))
+
+    def memoize(self, kind, inputs, compute):
+        # Cached JSON result of compute() for the given inputs
+        key = cache_key(kind, inputs)
+        value = self.get_json(key)
+        if value is None:
+            value = compute()
+            self.put_json(key, value)
+        return value
+
+    def _entries(self, suffix=".json"):
+        entries = []
+        try:
+            shards = [d.path for d in os.scandir(self.directory) if d.is_dir()]
+        except OSError:
+            return entries
+        for shard in shards:
+            try:
+                for entry in os.scandir(shard):
+                    if entry.name.endswith(suffix):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+            except OSError:
+                continue
+        return entries
+
+    def size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        # Trim to 90% of max_bytes, oldest access first
+        lock = os.path.join(self.directory, ".lock")
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock) > 60:
+                    os.remove(lock)  # stale lock from a crashed process
+            except OSError:
+                pass
+            return
+        except OSError:
+            return
+        try:
+            # Leftovers from writes interrupted by a crash; recent ones may still be in progress
+            self._remove(path for mtime, _, path in self._entries(".tmp") if time.time() - mtime > 60)
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+            self._written = 0
+        finally:
+            os.close(fd)
+            try:
+                os.remove(lock)
+            except OSError:
+                pass
+
+    def clear(self):
+        self._remove(path for _, _, path in self._entries() + self._entries(".tmp"))
+
+    @staticmethod
+    def _remove(paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_result_cache = None
+
+
+def get_result_cache():
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache()
+    return _result_cache
+
+#############################################################
+# Worst-case corner analysis
+WORST_CASE_INPUTS = SENSITIVITY_INPUTS
+WORST_CASE_RATINGS = (
+    "vin", "vout", "duty_cycle", "input_current", "inductor_current_peak",
+    "switch_current_peak", "diode_current_peak", "current_ripple", "voltage_ripple",
+    "inductor_current_rms", "switch_current_rms", "switch_current_avg", "diode_current_rms",
+    "diode_current_avg", "input_cap_current_rms", "output_cap_current_rms", "switch_voltage", "diode_voltage"
+)
+
+
+def _unit_grid(k, m):
+    # All points of an m-per-axis grid over the unit cube, shape (m**k, k)
+    return _product_grid([np.linspace(0, 1, m)] * k)
+
+
+def _product_grid(axes):
+    mesh = np.meshgrid(*axes, indexing="ij")
+    return np.stack([a.ravel() for a in mesh], axis=-1).reshape(-1, len(axes))
+
+
+def _pick_worst(score, u, u_nom):
+    # Index of the largest score; ties go to the point closest to nominal so
+    # inputs a rating does not depend on are reported at their nominal value
+    top = np.max(score)
+    ties = np.flatnonzero(score >= top - 1e-12 * abs(top))
+    return ties[np.argmin(np.abs(u[ties] - u_nom).sum(axis=1))]
+
+
+def worst_case_analysis(conv_type, nominal, ranges, grid_points=5, refine_steps=8, max_points=200000):
+    """Worst case of every rating in WORST_CASE_RATINGS over the given ranges.
+
+    nominal maps every name in WORST_CASE_INPUTS to its nominal value and
+    ranges maps the varied inputs to (min, max). All 2^k corners and a coarse
+    interior grid are evaluated in one batch, then each rating's worst point is
+    refined with a shrinking local stencil to catch interior extrema. Points
+    whose duty cycle the topology cannot reach (Topology.feasible) or with
+    non-finite results are excluded.
+    Returns {"ratings": {rating: {"value", "nominal", "point", "corner"}},
+    "points": n, "excluded": m} where point holds the limiting value of every
+    input and m of the n corner/grid points were excluded.
+    """
+    topology = get_topology(conv_type)
+    names = [n for n in WORST_CASE_INPUTS if n in ranges and ranges[n][0] != ranges[n][1]]
+    k = len(names)
+    lo = np.array([ranges[n][0] for n in names], dtype=float)
+    hi = np.array([ranges[n][1] for n in names], dtype=float)
+
+    def evaluate(u):
+        args = {n: np.full(len(u), float(nominal[n])) for n in WORST_CASE_INPUTS}
+        for j, n in enumerate(names):
+            args[n] = lo[j] + u[:, j] * (hi[j] - lo[j])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = design_equations(conv_type, args["vin"], args["vout"], args["iout"], args["fsw"],
+                                   args["efficiency"], l=args["inductor"], c=args["capacitor"], n=args["turns_ratio"])
+        out = {r: np.broadcast_to(np.asarray(out[r], dtype=float), len(u)) for r in WORST_CASE_RATINGS + ("duty_cycle",)}
+        feasible = topology.feasible(out["duty_cycle"])
+        for r in WORST_CASE_RATINGS:
+            feasible &= np.isfinite(out[r])
+        scores = {r: (out[r], np.where(feasible, np.abs(out[r]), -np.inf)) for r in WORST_CASE_RATINGS}
+        return scores, feasible
+
+    # Corners (each axis at min, nominal or max) plus a coarse grid, the
+    # largest grid that stays under max_points
+    u_nom = np.clip([(float(nominal[n]) - lo[j]) / (hi[j] - lo[j]) for j, n in enumerate(names)], 0, 1)
+    m = grid_points
+    while k and m > 2 and m ** k > max_points:
+        m -= 1
+    if k:
+        u = np.unique(np.vstack([_product_grid([[0.0, un, 1.0] for un in u_nom]), _unit_grid(k, m)]), axis=0)
+    else:
+        u = np.zeros((1, 0))
+    scores, feasible = evaluate(u)
+    points, excluded = len(u), int(np.count_nonzero(~feasible))
+    best_u, best = {}, {}
+    for r in WORST_CASE_RATINGS:
+        i = _pick_worst(scores[r][1], u, u_nom)
+        best_u[r] = u[i]
+        best[r] = (scores[r][0][i], scores[r][1][i])
+
+    # Local refinement around every rating's current worst point, one batch per step
+    if k:
+        stencil = _unit_grid(k, 3) * 2 - 1
+        step = 1.0 / max(m - 1, 1)
+        for _ in range(refine_steps):
+            step /= 2
+            u = np.clip(np.vstack([best_u[r] + stencil * step for r in WORST_CASE_RATINGS]), 0, 1)
+            scores, _ = evaluate(u)
+            for r in WORST_CASE_RATINGS:
+                i = _pick_worst(scores[r][1], u, u_nom)
+                if scores[r][1][i] > best[r][1] * (1 + 1e-12):
+                    best_u[r] = u[i]
+                    best[r] = (scores[r][0][i], scores[r][1][i])
+
+    nominal_out = design_equations(conv_type, nominal["vin"], nominal["vout"], nominal["iout"], nominal["fsw"],
+                                   nominal["efficiency"], l=nominal["inductor"], c=nominal["capacitor"],
+                                   n=nominal["turns_ratio"])
+    results = {}
+    for r in WORST_CASE_RATINGS:
+        point = {n: float(nominal[n]) for n in WORST_CASE_INPUTS}
+        for j, n in enumerate(names):
+            point[n] = float(lo[j] + best_u[r][j] * (hi[j] - lo[j]))
+        results[r] = {
+            "value": float(best[r][0]),
+            "nominal": float(nominal_out[r]),
+            "point": point,
+            "corner": bool(np.all(np.isclose(best_u[r], 0) | np.isclose(best_u[r], 1) | np.isclose(best_u[r], u_nom)))
+        }
+    return {"ratings": results, "points": points, "excluded": excluded}
+
+#############################################################
+# Magnetics designer
+#
+# Approximate catalogue data. Materials use the Steinmetz fit
+# Pv [W/m³] = k · f[Hz]^alpha · Bac[T]^beta; bsat is the usable flux at 100 °C.
+MAGNETIC_MATERIALS = {
+    "N87": {"bsat": 0.39, "k": 16.9, "alpha": 1.25, "beta": 2.35},
+    "Kool Mu 60": {"bsat": 0.50, "k": 21.4, "alpha": 1.29, "beta": 2.0},
+}
+
+# name, material, Ae (mm²), le (mm), Aw (mm²), MLT (mm), AL (nH/turn²) or None for gapped ferrite
+CORE_SHAPES = (
+    ("E13/7/4", "N87", 12.4, 29.7, 13.6, 24.0, None),
+    ("E16/8/5", "N87", 20.1, 37.6, 22.6, 33.0, None),
+    ("E20/10/6", "N87", 32.0, 46.0, 35.3, 39.0, None),
+    ("E25/13/7", "N87", 52.5, 57.5, 61.0, 49.0, None),
+    ("ETD29", "N87", 76.0, 72.0, 97.0, 52.8, None),
+    ("ETD34", "N87", 97.1, 78.6, 123.0, 60.0, None),
+    ("ETD39", "N87", 125.0, 92.2, 177.0, 69.0, None),
+    ("ETD44", "N87", 173.0, 103.0, 214.0, 77.6, None),
+    ("PQ20/16", "N87", 62.0, 37.4, 29.0, 44.0, None),
+    ("PQ26/25", "N87", 120.0, 55.5, 57.0, 56.0, None),
+    ("PQ32/30", "N87", 161.0, 74.6, 103.0, 67.0, None),
+    ("RM8", "N87", 64.0, 38.0, 30.0, 42.0, None),
+    ("RM10", "N87", 98.0, 44.0, 45.0, 52.0, None),
+    ("T14/7/6", "Kool Mu 60", 21.0, 31.7, 38.5, 22.0, 50),
+    ("T17/9/7", "Kool Mu 60", 26.0, 41.1, 70.9, 24.0, 48),
+    ("T20/12/7", "Kool Mu 60", 28.0, 50.8, 122.7, 25.0, 42),
+    ("T27/15/11", "Kool Mu 60", 68.8, 63.2, 165.1, 37.5, 82),
+    ("T33/20/11", "Kool Mu 60", 74.2, 80.6, 298.6, 38.5, 69),
+    ("T40/24/15", "Kool Mu 60", 120.0, 98.4, 452.4, 49.0, 92),
+)
+
+# Air-gapped AL grades stocked for every ferrite shape (nH/turn²)
+FERRITE_AL_GRADES = (63, 100, 160, 250, 400)
+
+# AWG: bare copper diameter (mm)
+WIRE_GAUGES = {
+    14: 1.628, 16: 1.291, 18: 1.024, 20: 0.812, 22: 0.644, 24: 0.511,
+    26: 0.405, 28: 0.321, 30: 0.255, 32: 0.202, 34: 0.160, 36: 0.127,
+}
+WIRE_STRANDS = (1, 2, 3, 4, 6, 8)
+WIRE_INSULATION_FACTOR = 1.12  # insulated / bare diameter
+RHO_COPPER_100C = 2.26e-8  # Ω·m
+MU_0 = 4e-7 * np.pi
+
+
+class CoreDatabase:
+    """Core catalogue held as column arrays with sorted indexes on AL,
+    area product (Ae·Aw) and saturation flux for range queries."""
+
+    def __init__(self, shapes=CORE_SHAPES, materials=MAGNETIC_MATERIALS, al_grades=FERRITE_AL_GRADES):
+        rows = []
+        for name, material, ae, le, aw, mlt, al in shapes:
+            for grade in ([al] if al else al_grades):
+                label = name if al else f"{name} AL{grade}"
+                rows.append((label, material, ae * 1e-6, le * 1e-3, aw * 1e-6, mlt * 1e-3, grade * 1e-9))
+        self.name = np.array([r[0] for r in rows])
+        self.material = np.array([r[1] for r in rows])
+        self.ae, self.le, self.aw, self.mlt, self.al = (np.array([r[i] for r in rows]) for i in range(2, 7))
+        self.volume = self.ae * self.le
+        self.area_product = self.ae * self.aw
+        for key in ("bsat", "k", "alpha", "beta"):
+            setattr(self, key, np.array([materials[m][key] for m in self.material]))
+
+        self._index = {}
+        self.fingerprint = cache_key("core_database", [shapes, materials, al_grades])
+
+        for key in ("al", "area_product", "bsat"):
+            order = np.argsort(getattr(self, key), kind="stable")
+            self._index[key] = (order, getattr(self, key)[order])
+
+    def __len__(self):
+        return len(self.name)
+
+    def _range(self, key, lo, hi):
+        order, values = self._index[key]
+        return order[np.searchsorted(values, lo, "left"):np.searchsorted(values, hi, "right")]
+
+    def query(self, al=(0, np.inf), area_product=(0, np.inf), bsat=(0, np.inf)):
+        # Row indices of the cores inside every given range
+        rows = self._range("al", *al)
+        rows = np.intersect1d(rows, self._range("area_product", *area_product))
+        return np.intersect1d(rows, self._range("bsat", *bsat))
+
+
+_core_database = None
+
+
+def get_core_database():
+    global _core_database
+    if _core_database is None:
+        _core_database = CoreDatabase()
+    return _core_database
+
+
+def design_magnetics(l, i_peak, i_rms, delta_i, fsw, database=None, bsat_margin=0.2, fill_factor=0.4,
+                     j_max=6e6, loss_limit=np.inf, turns_span=8, top=10):
+    """Lowest-loss core/turns/wire combinations that realise inductance l.
+
+    Every core from the database index, turns from the minimum that reaches l
+    upwards, and every gauge × strand count are evaluated as one broadcast
+    array (cores × turns × wires). A design is feasible when L ≥ l, peak flux
+    stays below (1 - bsat_margin)·Bsat, the winding fits in fill_factor of the
+    window, current density is at most j_max (A/m²) and total loss is within
+    loss_limit (W). Returns up to top dicts sorted by total loss.
+    """
+    db = database or get_core_database()
+    b_limit = 1 - bsat_margin
+
+    # Area-product bound: Ae·Aw ≥ L·Ipk·Irms / (Bmax·Ku·Jmax)
+    ap_min = l * i_peak * i_rms / (db.bsat.max() * b_limit * fill_factor * j_max)
+    rows = db.query(al=(0, l), area_product=(ap_min, np.inf))
+    if len(rows) == 0:
+        return []
+    ae, aw, mlt, al, vol = (getattr(db, key)[rows][:, None, None] for key in ("ae", "aw", "mlt", "al", "volume"))
+    bsat, k, alpha, beta = (getattr(db, key)[rows][:, None, None] for key in ("bsat", "k", "alpha", "beta"))
+
+    # Turns: cores × turns
+    turns = np.ceil(np.sqrt(l / al) - 1e-9) + np.arange(turns_span)[None, :, None]
+    l_actual = al * turns**2
+    b_peak = l_actual * i_peak / (turns * ae)
+    b_ac = l_actual * delta_i / (2 * turns * ae)
+    core_loss = k * fsw**alpha * b_ac**beta * vol
+
+    # Wires: gauge × strands, with a round-wire skin-effect factor on the ripple current
+    gauges = np.array(list(WIRE_GAUGES))
+    awg = np.repeat(gauges, len(WIRE_STRANDS))
+    strands = np.tile(WIRE_STRANDS, len(gauges))
+    dia = np.repeat([WIRE_GAUGES[g] * 1e-3 for g in gauges], len(WIRE_STRANDS))
+    cu_area = strands * np.pi * dia**2 / 4
+    wire_area = strands * np.pi * (dia * WIRE_INSULATION_FACTOR)**2 / 4
+    skin_depth = np.sqrt(RHO_COPPER_100C / (np.pi * fsw * MU_0))
+    rac_factor = np.maximum(1, dia / (4 * skin_depth) + 0.25)
+
+    i_ac_sq = delta_i**2 / 12
+    i_dc_sq = max(i_rms**2 - i_ac_sq, 0)
+    r_dc = RHO_COPPER_100C * turns * mlt / cu_area
+    copper_loss = r_dc * (i_dc_sq + i_ac_sq * rac_factor)
+    fill = turns * wire_area / aw
+    total_loss = core_loss + copper_loss
+
+    feasible = ((b_peak <= bsat * b_limit) & (fill <= fill_factor)
+                & (i_rms / cu_area <= j_max) & (total_loss <= loss_limit))
+    total_loss, feasible = np.broadcast_arrays(total_loss, feasible)
+    candidates = np.flatnonzero(feasible)
+    if len(candidates) == 0:
+        return []
+    best = candidates[np.argsort(total_loss.ravel()[candidates], kind="stable")[:top]]
+
+    shape = total_loss.shape
+    results = []
+    for core_i, turn_i, wire_i in zip(*np.unravel_index(best, shape)):
+        core = rows[core_i]
+        results.append({
+            "core": str(db.name[core]),
+            "material": str(db.material[core]),
+            "turns": int(turns[core_i, turn_i, 0]),
+            "awg": int(awg[wire_i]),
+            "strands": int(strands[wire_i]),
+            "inductance": float(l_actual[core_i, turn_i, 0]),
+            "b_peak": float(b_peak[core_i, turn_i, 0]),
+            "fill": float(fill[core_i, turn_i, wire_i]),
+            "current_density": float(i_rms / cu_area[wire_i]),
+            "core_loss": float(core_loss[core_i, turn_i, 0]),
+            "copper_loss": float(copper_loss[core_i, turn_i, wire_i]),
+            "total_loss": float(total_loss[core_i, turn_i, wire_i]),
+        })
+    return results
+
+#############################################################
+# Multi-design comparison workspace
+class ComparisonWorkspace:
+    """Window overlaying many designs on shared axes with a comparison table.
+
+    Each trace family is drawn as one LineCollection whose segment list grows
+    with the workspace, so adding a design appends arrays instead of creating
+    artists. designs is the application's list and is mutated in place.
+    """
+    FAMILIES = (
+        ("inductor_current", "Inductor Current", "Current (A)"),
+        ("ripple", "Output Voltage Ripple", "Ripple (mV)"),
+        ("power", "Output Power", "Power (W)"),
+    )
+    PHASE = np.linspace(0, 2, 400)  # two switching periods
+    COLUMNS = (
+        ("name", "Design", 150), ("type", "Type", 80), ("vin", "Vin (V)", 60), ("vout", "Vout (V)", 60),
+        ("iout", "Iout (A)", 60), ("fsw", "fsw (kHz)", 70), ("duty", "D", 50), ("l", "L (µH)", 70),
+        ("c", "C (µF)", 70), ("il_peak", "IL pk (A)", 70), ("isw_rms", "Isw rms (A)", 80), ("ripple", "ΔV (mV)", 70),
+    )
+
+    def __init__(self, root, designs):
+        self.designs = designs
+        self.segments = {key: [] for key, _, _ in self.FAMILIES}
+
+        self.window = tk.Toplevel(root)
+        self.window.title("Comparison Workspace")
+        self.window.geometry("1100x750")
+
+        self.figure = plt.Figure(figsize=(11, 4), dpi=100)
+        self.axes = {}
+        self.collections = {}
+        for i, (key, title, ylabel) in enumerate(self.FAMILIES):
+            ax = self.figure.add_subplot(1, len(self.FAMILIES), i + 1)
+            ax.set_title(title)
+            ax.set_xlabel("Time (switching periods)")
+            ax.set_ylabel(ylabel)
+            ax.grid(True)
+            collection = LineCollection([], linewidths=1.2)
+            ax.add_collection(collection)
+            self.axes[key] = ax
+            self.collections[key] = collection
+        self.canvas = FigureCanvasTkAgg(self.figure, self.window)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        table_frame = ttk.Frame(self.window)
+        table_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        self.tree = ttk.Treeview(table_frame, columns=[c[0] for c in self.COLUMNS], show="headings", height=8)
+        for col, heading, width in self.COLUMNS:
+            self.tree.heading(col, text=heading)
+            self.tree.column(col, width=width, anchor="w" if col in ("name", "type") else "e")
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.tree.config(yscrollcommand=scrollbar.set)
+
+        button_frame = ttk.Frame(self.window)
+        button_frame.pack(fill="x", padx=10, pady=(0, 10))
+        ttk.Button(button_frame, text="Remove Selected", command=self.remove_selected).pack(side="left")
+        ttk.Button(button_frame, text="Clear", command=self.clear).pack(side="left", padx=5)
+
+        self._append(list(self.designs))
+        self.redraw()
+
+    def exists(self):
+        return bool(self.window.winfo_exists())
+
+    @classmethod
+    def trace_batch(cls, designs, phase=None):
+        # Trace families for a batch of designs, one waveform kernel call per topology
+        phase = cls.PHASE if phase is None else phase
+        out = {key: np.empty((len(designs), len(phase))) for key, _, _ in cls.FAMILIES}
+        rows_by_type = {}
+        for i, design in enumerate(designs):
+            rows_by_type.setdefault(design["type"], []).append(i)
+        for conv_type, rows in rows_by_type.items():
+            params = {key: np.array([designs[i]["parameters"][key] for i in rows])[:, None]
+                      for key in designs[rows[0]]["parameters"]}
+            waves = get_topology(conv_type).waveforms(params, phase[None, :] / params["fsw"])
+            ripple = np.abs(params["voltage_ripple"]) * np.sin(2 * np.pi * phase)[None, :]
+            out["inductor_current"][rows] = waves["inductor_current"]
+            out["ripple"][rows] = ripple * 1e3
+            out["power"][rows] = (np.abs(params["vout"]) + ripple) * params["iout"]
+        return out
+
+    def _append(self, designs):
+        if not designs:
+            return
+        traces = self.trace_batch(designs)
+        start = len(self.segments[self.FAMILIES[0][0]])
+        for key, _, _ in self.FAMILIES:
+            points = np.stack([np.broadcast_to(self.PHASE, traces[key].shape), traces[key]], axis=-1)
+            self.segments[key].extend(points)
+            self.axes[key].update_datalim(points.reshape(-1, 2))
+        for i, design in enumerate(designs):
+            self._insert_row(start + i, design)
+
+    @staticmethod
+    def palette(n):
+        # tab10 while it lasts, then n evenly spaced colours so no two designs share one
+        if n <= 10:
+            return [plt.cm.tab10(i) for i in range(n)]
+        return list(plt.cm.turbo(np.linspace(0.05, 0.95, n)))
+
+    def _insert_row(self, index, design):
+        p = design["parameters"]
+        tag = f"design{index}"
+        self.tree.insert("", tk.END, iid=str(index), tags=(tag,), values=(
+            f"{index + 1}: {design['type']} {p['vin']:g}→{p['vout']:g} V", design["type"],
+            f"{p['vin']:.2f}", f"{p['vout']:.2f}", f"{p['iout']:.2f}", f"{p['fsw']/1000:.1f}",
+            f"{p['duty_cycle']:.3f}", f"{p['inductor']*1e6:.2f}", f"{p['capacitor']*1e6:.2f}",
+            f"{p['inductor_current_peak']:.2f}", f"{p.get('switch_current_rms', float('nan')):.2f}",
+            f"{abs(p['voltage_ripple'])*1e3:.2f}"))
+
+    def redraw(self):
+        # Colours depend on the design count, so table rows are re-tagged too
+        colors = self.palette(len(self.designs))
+        for index, color in enumerate(colors):
+            self.tree.tag_configure(f"design{index}", foreground=matplotlib.colors.to_hex(color))
+        for key, _, _ in self.FAMILIES:
+            self.collections[key].set_segments(self.segments[key])
+            self.collections[key].set_colors(colors)
+            self.axes[key].autoscale_view()
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+
+    def add(self, design):
+        self.designs.append(design)
+        self._append([design])
+        self.redraw()
+
+    def _rebuild(self):
+        # Full rebuild after removals; designs keep one batched pass
+        self.segments = {key: [] for key, _, _ in self.FAMILIES}
+        self.tree.delete(*self.tree.get_children())
+        for ax in self.axes.values():
+            ax.ignore_existing_data_limits = True
+        self._append(list(self.designs))
+        self.redraw()
+
+    def remove_selected(self):
+        selected = {int(iid) for iid in self.tree.selection()}
+        if not selected:
+            return
+        self.designs[:] = [d for i, d in enumerate(self.designs) if i not in selected]
+        self._rebuild()
+
+    def clear(self):
+        self.designs.clear()
+        self._rebuild()
+
+#############################################################
 class DCDCConverterDesigner:
     def __init__(self, root):
         self.root = root
@@ -18,6 +1109,8 @@ class DCDCConverterDesigner:
         self.root.geometry("1200x800")
         self.setup_ui()
         self.current_design = {}
+        self.workspace = []
+        self.workspace_window = None
         self.create_menus()
         
     def setup_ui(self):
@@ -44,7 +1137,7 @@ class DCDCConverterDesigner:
     def setup_input_controls(self):
         # Converter type selection
         ttk.Label(self.input_frame, text="Converter Type:").grid(row=0, column=0, sticky="e", pady=2)
-        self.converter_type = ttk.Combobox(self.input_frame, values=["Buck", "Boost", "Buck-Boost"])
+        self.converter_type = ttk.Combobox(self.input_frame, values=list(TOPOLOGIES))
         self.converter_type.grid(row=0, column=1, pady=2, sticky="w")
         self.converter_type.current(0)
         self.converter_type.bind("<<ComboboxSelected>>", self.on_converter_change)
@@ -57,7 +1150,8 @@ class DCDCConverterDesigner:
             "switching_freq": {"label": "Switching Frequency", "unit": "kHz", "default": "500", "row": 4},
             "efficiency": {"label": "Efficiency (η)", "unit": "", "default": "0.9", "row": 5},
             "voltage_ripple": {"label": "Voltage Ripple", "unit": "%", "default": "1", "row": 6},
-            "current_ripple": {"label": "Current Ripple", "unit": "%", "default": "30", "row": 7}
+            "current_ripple": {"label": "Current Ripple", "unit": "%", "default": "30", "row": 7},
+            "turns_ratio": {"label": "Turns Ratio (Np/Ns)", "unit": "", "default": "1", "row": 8}
         }
 
         self.entries = {}
@@ -69,54 +1163,81 @@ class DCDCConverterDesigner:
             self.entries[key].insert(0, param["default"])
             self.entries[key].pack(side="left")
             ttk.Label(frame, text=param["unit"]).pack(side="left", padx=5)
+        self.update_turns_ratio_state()
+
+        # Worst-case min/max ranges (leave blank to hold an input at its nominal value)
+        self.range_params = ("input_voltage", "output_voltage", "output_current", "switching_freq", "efficiency")
+        ttk.Label(self.input_frame, text="Min").grid(row=0, column=2, sticky="w")
+        ttk.Label(self.input_frame, text="Max").grid(row=0, column=3, sticky="w")
+        self.range_entries = {}
+        for key in self.range_params:
+            row = self.params[key]["row"]
+            min_entry = ttk.Entry(self.input_frame, width=8)
+            min_entry.grid(row=row, column=2, sticky="w", padx=2)
+            max_entry = ttk.Entry(self.input_frame, width=8)
+            max_entry.grid(row=row, column=3, sticky="w", padx=2)
+            self.range_entries[key] = (min_entry, max_entry)
 ##################################################################################
         # Calculated components display
-        ttk.Label(self.input_frame, text="Calculated Components:").grid(row=8, column=0, columnspan=2, pady=(10,2), sticky="w")
+        ttk.Label(self.input_frame, text="Calculated Components:").grid(row=9, column=0, columnspan=2, pady=(10,2), sticky="w")
 
         # Inductor value and unit selection
-        ttk.Label(self.input_frame, text="Inductor (L):").grid(row=9, column=0, sticky="e", pady=2)
+        ttk.Label(self.input_frame, text="Inductor (L):").grid(row=10, column=0, sticky="e", pady=2)
         self.inductor_value = ttk.Label(self.input_frame, text="", width=10)
-        self.inductor_value.grid(row=9, column=1, sticky="w")
+        self.inductor_value.grid(row=10, column=1, sticky="w")
         self.l_unit_var = tk.StringVar(value="µH")
         self.l_unit_combo = ttk.Combobox(self.input_frame, textvariable=self.l_unit_var, values=["nH", "µH", "mH", "H"], width=4, state="readonly")
-        self.l_unit_combo.grid(row=9, column=1, sticky="e")
+        self.l_unit_combo.grid(row=10, column=1, sticky="e")
         self.l_unit_combo.bind("<<ComboboxSelected>>", lambda e: self.calculate())
 
         # Custom inductor entry
         self.custom_l_var = tk.StringVar()
         self.custom_l_entry = ttk.Entry(self.input_frame, textvariable=self.custom_l_var, width=10)
-        self.custom_l_entry.grid(row=9, column=2, sticky="w")
+        self.custom_l_entry.grid(row=10, column=2, sticky="w")
         self.custom_l_unit_var = tk.StringVar(value="µH")
         self.custom_l_unit_combo = ttk.Combobox(self.input_frame, textvariable=self.custom_l_unit_var, values=["nH", "µH", "mH", "H"], width=4, state="readonly")
-        self.custom_l_unit_combo.grid(row=9, column=3, sticky="w")
+        self.custom_l_unit_combo.grid(row=10, column=3, sticky="w")
         self.custom_l_unit_combo.bind("<<ComboboxSelected>>", lambda e: self.calculate())
 
         # Capacitor value and unit selection
-        ttk.Label(self.input_frame, text="Capacitor (C):").grid(row=10, column=0, sticky="e", pady=2)
+        ttk.Label(self.input_frame, text="Capacitor (C):").grid(row=11, column=0, sticky="e", pady=2)
         self.capacitor_value = ttk.Label(self.input_frame, text="", width=10)
-        self.capacitor_value.grid(row=10, column=1, sticky="w")
+        self.capacitor_value.grid(row=11, column=1, sticky="w")
         self.c_unit_var = tk.StringVar(value="µF")
         self.c_unit_combo = ttk.Combobox(self.input_frame, textvariable=self.c_unit_var, values=["nF", "µF", "mF", "F"], width=4, state="readonly")
-        self.c_unit_combo.grid(row=10, column=1, sticky="e")
+        self.c_unit_combo.grid(row=11, column=1, sticky="e")
         self.c_unit_combo.bind("<<ComboboxSelected>>", lambda e: self.calculate())
 
         # Custom capacitor entry
         self.custom_c_var = tk.StringVar()
         self.custom_c_entry = ttk.Entry(self.input_frame, textvariable=self.custom_c_var, width=10)
-        self.custom_c_entry.grid(row=10, column=2, sticky="w")
+        self.custom_c_entry.grid(row=11, column=2, sticky="w")
         self.custom_c_unit_var = tk.StringVar(value="µF")
         self.custom_c_unit_combo = ttk.Combobox(self.input_frame, textvariable=self.custom_c_unit_var, values=["nF", "µF", "mF", "F"], width=4, state="readonly")
-        self.custom_c_unit_combo.grid(row=10, column=3, sticky="w")
+        self.custom_c_unit_combo.grid(row=11, column=3, sticky="w")
         self.custom_c_unit_combo.bind("<<ComboboxSelected>>", lambda e: self.calculate())
 #######################################################################
 
         # Checkbox to use custom values
         self.use_custom_lc = tk.BooleanVar()
         self.custom_lc_check = ttk.Checkbutton(self.input_frame, text="Use Custom L/C", variable=self.use_custom_lc, command=self.calculate)
-        self.custom_lc_check.grid(row=11, column=0, columnspan=2, sticky="w")
+        self.custom_lc_check.grid(row=12, column=0, columnspan=2, sticky="w")
+
+        # L/C tolerances for the worst-case corners
+        ttk.Label(self.input_frame, text="L/C Tolerance (±):").grid(row=13, column=0, sticky="e", pady=2)
+        tol_frame = ttk.Frame(self.input_frame)
+        tol_frame.grid(row=13, column=1, columnspan=3, sticky="w")
+        ttk.Label(tol_frame, text="L").pack(side="left")
+        self.l_tol_entry = ttk.Entry(tol_frame, width=6)
+        self.l_tol_entry.pack(side="left", padx=2)
+        ttk.Label(tol_frame, text="%   C").pack(side="left")
+        self.c_tol_entry = ttk.Entry(tol_frame, width=6)
+        self.c_tol_entry.pack(side="left", padx=2)
+        ttk.Label(tol_frame, text="%").pack(side="left")
 
         # Buttons
-        ttk.Button(self.input_frame, text="Calculate", command=self.calculate).grid(row=12, column=0, columnspan=2, pady=10)
+        ttk.Button(self.input_frame, text="Calculate", command=self.calculate).grid(row=14, column=0, columnspan=2, pady=10)
+        ttk.Button(self.input_frame, text="Add to Comparison", command=self.add_to_comparison).grid(row=14, column=2, columnspan=2, pady=10)
 
         ##################################################
     def setup_output_controls(self):
@@ -145,12 +1266,26 @@ class DCDCConverterDesigner:
         self.inductor_peak_label.grid(row=1, column=1, sticky="w", padx=2)
         ttk.Label(ratings_inner_frame, text="A").grid(row=1, column=2, sticky="w")
 
-        self.ratings_text = tk.Text(self.ratings_frame, height=8, width=40, wrap=tk.WORD)
+        self.ratings_text = tk.Text(self.ratings_frame, height=10, width=40, wrap=tk.WORD)
         self.ratings_text.pack(fill="both", expand=True)
 
+        # Sensitivity table (ranked by normalized sensitivity)
+        self.sensitivity_frame = ttk.LabelFrame(self.output_frame, text="Sensitivity (ranked)", padding=10)
+        self.sensitivity_frame.grid(row=0, column=2, rowspan=2, sticky="nsew", padx=(10, 0))
+        columns = ("output", "input", "dydx", "normalized")
+        self.sensitivity_tree = ttk.Treeview(self.sensitivity_frame, columns=columns, show="headings", height=15)
+        for col, heading, width in zip(columns, ("Output", "Input", "dy/dx", "%/%"), (150, 80, 80, 60)):
+            self.sensitivity_tree.heading(col, text=heading)
+            self.sensitivity_tree.column(col, width=width, anchor="w" if col in ("output", "input") else "e")
+        self.sensitivity_tree.pack(side="left", fill="both", expand=True)
+        sens_scrollbar = ttk.Scrollbar(self.sensitivity_frame, orient="vertical", command=self.sensitivity_tree.yview)
+        sens_scrollbar.pack(side="right", fill="y")
+        self.sensitivity_tree.config(yscrollcommand=sens_scrollbar.set)
+
         # Configure grid weights
         self.output_frame.grid_rowconfigure(0, weight=1)
         self.output_frame.grid_columnconfigure(0, weight=1)
+        self.output_frame.grid_columnconfigure(2, weight=1)
         
     def setup_graph_controls(self):
         # Create figure and canvas (EXACTLY AS IN ORIGINAL CODE)
@@ -187,6 +1322,15 @@ class DCDCConverterDesigner:
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
         menubar.add_cascade(label="File", menu=file_menu)
+
+        # Tools menu
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        tools_menu.add_command(label="Magnetics Designer", command=self.open_magnetics_designer)
+        tools_menu.add_command(label="Add Design to Comparison", command=self.add_to_comparison)
+        tools_menu.add_command(label="Comparison Workspace", command=self.open_comparison)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Clear Result Cache", command=self.clear_result_cache)
+        menubar.add_cascade(label="Tools", menu=tools_menu)
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -205,15 +1349,15 @@ class DCDCConverterDesigner:
         self.ratings_text.delete(1.0, tk.END)
         
         # Update default values based on converter type
-        if conv_type == "Buck":
-            self.entries["output_voltage"].delete(0, tk.END)
-            self.entries["output_voltage"].insert(0, "5")
-        elif conv_type == "Boost":
-            self.entries["output_voltage"].delete(0, tk.END)
-            self.entries["output_voltage"].insert(0, "24")
-        elif conv_type == "Buck-Boost":
-            self.entries["output_voltage"].delete(0, tk.END)
-            self.entries["output_voltage"].insert(0, "-12")
+        topology = get_topology(conv_type)
+        self.entries["output_voltage"].delete(0, tk.END)
+        self.entries["output_voltage"].insert(0, topology.default_vout)
+        self.update_turns_ratio_state()
+
+    def update_turns_ratio_state(self):
+        # The turns ratio only applies to isolated topologies
+        isolated = get_topology(self.converter_type.get()).isolated
+        self.entries["turns_ratio"].config(state="normal" if isolated else "disabled")
             
     def validate_inputs(self):
         try:
@@ -223,33 +1367,75 @@ class DCDCConverterDesigner:
                 values[key] = float(self.entries[key].get())
                 
             # Basic validation
-            if values["input_voltage"] <= 0:
-                raise ValueError("Input voltage must be positive")
-            if values["output_voltage"] == 0:
-                raise ValueError("Output voltage cannot be zero")
-            if values["output_current"] <= 0:
-                raise ValueError("Output current must be positive")
-            if values["switching_freq"] <= 0:
-                raise ValueError("Switching frequency must be positive")
-            if not (0 < values["efficiency"] <= 1):
-                raise ValueError("Efficiency must be between 0 and 1")
+            for key in ("input_voltage", "output_voltage", "output_current", "switching_freq", "efficiency"):
+                self.check_input_value(key, values[key])
             if values["voltage_ripple"] <= 0:
                 raise ValueError("Voltage ripple must be positive")
             if values["current_ripple"] <= 0:
                 raise ValueError("Current ripple must be positive")
+            if values["turns_ratio"] <= 0:
+                raise ValueError("Turns ratio must be positive")
                 
             # Converter-specific validation
-            conv_type = self.converter_type.get()
-            if conv_type == "Buck" and values["output_voltage"] >= values["input_voltage"]:
-                raise ValueError("For Buck converter, output voltage must be less than input voltage")
-            elif conv_type == "Boost" and values["output_voltage"] <= values["input_voltage"]:
-                raise ValueError("For Boost converter, output voltage must be greater than input voltage")
+            topology = get_topology(self.converter_type.get())
+            if not topology.isolated:
+                values["turns_ratio"] = 1.0
+            topology.validate(values["input_voltage"], values["output_voltage"], values["efficiency"], values["turns_ratio"])
                 
             return True, values
         except ValueError as e:
             messagebox.showerror("Input Error", str(e))
             return False, None
 
+    def check_input_value(self, key, value, prefix=""):
+        # Rules shared by the nominal inputs and the worst-case min/max bounds
+        if key == "input_voltage" and value <= 0:
+            raise ValueError(prefix + "Input voltage must be positive")
+        if key == "output_voltage" and value == 0:
+            raise ValueError(prefix + "Output voltage cannot be zero")
+        if key == "output_current" and value <= 0:
+            raise ValueError(prefix + "Output current must be positive")
+        if key == "switching_freq" and value <= 0:
+            raise ValueError(prefix + "Switching frequency must be positive")
+        if key == "efficiency" and not (0 < value <= 1):
+            raise ValueError(prefix + "Efficiency must be between 0 and 1")
+
+    def read_worst_case_ranges(self, values):
+        # Map the min/max entries onto WORST_CASE_INPUTS names in base units
+        names = {"input_voltage": "vin", "output_voltage": "vout", "output_current": "iout",
+                 "switching_freq": "fsw", "efficiency": "efficiency"}
+        try:
+            ranges = {}
+            for key, (min_entry, max_entry) in self.range_entries.items():
+                lo_text, hi_text = min_entry.get().strip(), max_entry.get().strip()
+                if not lo_text and not hi_text:
+                    continue
+                lo = float(lo_text) if lo_text else values[key]
+                hi = float(hi_text) if hi_text else values[key]
+                label = self.params[key]["label"]
+                if lo > hi:
+                    raise ValueError(f"{label}: minimum must not exceed maximum")
+                self.check_input_value(key, lo, prefix=f"{label} minimum: ")
+                self.check_input_value(key, hi, prefix=f"{label} maximum: ")
+                if key == "output_voltage" and lo * hi <= 0:
+                    raise ValueError(f"{label}: range must not include zero")
+                if key == "switching_freq":
+                    lo, hi = lo * 1000, hi * 1000
+                ranges[names[key]] = (lo, hi)
+
+            tolerances = {}
+            for name, entry in (("inductor", self.l_tol_entry), ("capacitor", self.c_tol_entry)):
+                text = entry.get().strip()
+                if text:
+                    tol = float(text) / 100
+                    if not (0 <= tol < 1):
+                        raise ValueError("L/C tolerance must be between 0 and 100%")
+                    tolerances[name] = tol
+            return True, ranges, tolerances
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return False, None, None
+
 #############################################################
     def get_lc_multiplier(self, unit):
         # Helper for unit conversion
@@ -261,6 +1447,9 @@ class DCDCConverterDesigner:
     #####################################################################################
     def calculate(self):
         valid, values = self.validate_inputs()
+        if not valid:
+            return
+        valid, ranges, tolerances = self.read_worst_case_ranges(values)
         if not valid:
             return
 
@@ -272,46 +1461,14 @@ class DCDCConverterDesigner:
         eta = values["efficiency"]
         vripple_pct = values["voltage_ripple"] / 100  # Convert to ratio
         iripple_pct = values["current_ripple"] / 100  # Convert to ratio
+        n = values["turns_ratio"]
 
-        # Calculate duty cycle
-        if conv_type == "Buck":
-            d = vout / (vin * eta)
-        elif conv_type == "Boost":
-            d = 1 - (vin * eta / vout)
-        elif conv_type == "Buck-Boost":
-            d = vout / (vout - vin * eta) if vout < 0 else vout / (vin * eta + vout)
-
-        # Calculate currents
-        if conv_type == "Buck":
-            iin = iout * vout / (vin * eta)
-            il_avg = iout
-        elif conv_type == "Boost":
-            iin = iout * vout / (vin * eta)
-            il_avg = iin
-        elif conv_type == "Buck-Boost":
-            iin = iout * abs(vout) / (vin * eta)
-            il_avg = iin / (1 - d)
-
-        # AUTO-CALCULATE INDUCTOR VALUE
-        delta_il = il_avg * iripple_pct
-        if conv_type == "Buck":
-            l = (vin - vout) * d / (fsw * delta_il)
-        elif conv_type == "Boost":
-            l = vin * d / (fsw * delta_il)
-        elif conv_type == "Buck-Boost":
-            l = vin * d / (fsw * delta_il)
-
-        # AUTO-CALCULATE CAPACITOR VALUE
-        delta_vout = vout * vripple_pct
-        if conv_type == "Buck":
-            c = (1 - d) / (8 * l * fsw**2 * delta_vout)
-        elif conv_type == "Boost":
-            c = iout * d / (fsw * delta_vout)
-        elif conv_type == "Buck-Boost":
-            c = iout * d / (fsw * delta_vout)
-
-        # --- Use custom L/C if enabled ---
-       # --- Use custom L/C if enabled, with unit selection ---
+        # Size L and C from the ripple specifications
+        sized = design_equations(conv_type, vin, vout, iout, fsw, eta, vripple_pct, iripple_pct, n=n)
+        l = float(sized["inductor"])
+        c = float(sized["capacitor"])
+
+        # --- Use custom L/C if enabled, with unit selection ---
         use_custom = self.use_custom_lc.get()
         l_display = l / self.get_lc_multiplier(self.l_unit_var.get())
         c_display = c / self.get_lc_multiplier(self.c_unit_var.get())
@@ -331,44 +1488,24 @@ class DCDCConverterDesigner:
             except Exception:
                 pass
 
-        # Calculate actual ripples
-        if conv_type == "Buck":
-            delta_il_actual = (vin - vout) * d / (fsw * l)
-            delta_vout_actual = (1 - d) / (8 * l * c * fsw**2)
-        elif conv_type == "Boost":
-            delta_il_actual = vin * d / (fsw * l)
-            delta_vout_actual = iout * d / (fsw * c)
-        elif conv_type == "Buck-Boost":
-            delta_il_actual = vin * d / (fsw * l)
-            delta_vout_actual = iout * d / (fsw * c)
-
-        # Peak currents
-        il_peak = il_avg + delta_il_actual / 2
-        iswitch_peak = il_peak
-        idiode_peak = il_peak
+        # Evaluate actual ripples and peak currents for the chosen L/C
+        params = design_equations(conv_type, vin, vout, iout, fsw, eta, l=l, c=c, n=n)
 
         # Store results
         self.current_design = {
             "type": conv_type,
-            "parameters": {
-                "vin": vin,
-                "vout": vout,
-                "iout": iout,
-                "fsw": fsw,
-                "efficiency": eta,
-                "duty_cycle": d,
-                "inductor": l,
-                "capacitor": c,
-                "voltage_ripple": delta_vout_actual,
-                "current_ripple": delta_il_actual,
-                "input_current": iin,
-                "inductor_current_avg": il_avg,
-                "inductor_current_peak": il_peak,
-                "switch_current_peak": iswitch_peak,
-                "diode_current_peak": idiode_peak
-            }
+            "parameters": {key: float(value) for key, value in params.items()}
         }
 
+        # Worst case over line, load and component tolerance corners
+        if ranges or tolerances:
+            nominal = {name: self.current_design["parameters"][name] for name in WORST_CASE_INPUTS}
+            for name, tol in tolerances.items():
+                ranges[name] = (nominal[name] * (1 - tol), nominal[name] * (1 + tol))
+            self.current_design["worst_case"] = get_result_cache().memoize(
+                "worst_case", {"type": conv_type, "nominal": nominal, "ranges": ranges},
+                lambda: worst_case_analysis(conv_type, nominal, ranges))
+
         # Update calculated values display
         self.inductor_value.config(text=f"{l_display:.2f} {self.l_unit_var.get()}")
         self.capacitor_value.config(text=f"{c_display:.2f} {self.c_unit_var.get()}")
@@ -402,7 +1539,7 @@ class DCDCConverterDesigner:
         self.results_text.insert(tk.END, f"• Inductor Current (avg): {params['inductor_current_avg']:.2f} A\n")
         self.results_text.insert(tk.END, f"• Inductor Current (peak): {params['inductor_current_peak']:.2f} A\n")
         self.results_text.insert(tk.END, f"• Capacitor Value: {params['capacitor']*1e6:.2f} µF\n")
-        self.results_text.insert(tk.END, f"• Voltage Ripple: {params['voltage_ripple']/params['vout']*100:.2f}%\n")
+        self.results_text.insert(tk.END, f"• Voltage Ripple: {params['voltage_ripple']/abs(params['vout'])*100:.2f}%\n")
         self.results_text.insert(tk.END, f"• Current Ripple: {params['current_ripple']/params['inductor_current_avg']*100:.1f}%\n")
 
         # Update peak and average current labels in ratings frame
@@ -410,14 +1547,76 @@ class DCDCConverterDesigner:
         self.inductor_peak_label.config(text=f"{params['inductor_current_peak']:.2f}")
 
         # Display component ratings
-        self.ratings_text.insert(tk.END, "Component Ratings:\n")
-        self.ratings_text.insert(tk.END, f"• Inductor: {params['inductor']*1e6:.2f} µH, {params['inductor_current_peak']:.2f} A peak\n")
-        self.ratings_text.insert(tk.END, f"• Capacitor: {params['capacitor']*1e6:.2f} µF, {params['vout']:.1f} V\n")
-        self.ratings_text.insert(tk.END, f"• Switch: {params['vin']:.1f} V, {params['switch_current_peak']:.2f} A\n")
-        self.ratings_text.insert(tk.END, f"• Diode: {max(params['vin'], abs(params['vout'])):.1f} V, {params['diode_current_peak']:.2f} A\n")
-        
+        self.ratings_text.insert(tk.END, "Component Ratings (worst case):\n" if "worst_case" in design else "Component Ratings:\n")
+        for line in self.component_ratings():
+            self.ratings_text.insert(tk.END, f"• {line}\n")
+
+        self.display_sensitivities()
+
+    def component_ratings(self):
+        # Rating lines for the results panel and the PDF report. When a worst-case
+        # analysis is present every value is its worst case, followed by the
+        # corner that limits it and the number of infeasible points excluded.
+        design = self.current_design
+        params = design["parameters"]
+        worst = design["worst_case"]["ratings"] if "worst_case" in design else None
+
+        def rating(key):
+            return worst[key]["value"] if worst else params[key]
+
+        lines = [
+            f"Inductor: {params['inductor']*1e6:.2f} µH, {rating('inductor_current_peak'):.2f} A peak, "
+            f"{rating('inductor_current_rms'):.2f} A rms",
+            f"Input Capacitor: {rating('vin'):.1f} V, {rating('input_cap_current_rms'):.2f} A rms",
+            f"Output Capacitor: {params['capacitor']*1e6:.2f} µF, {abs(rating('vout')):.1f} V, "
+            f"{rating('output_cap_current_rms'):.2f} A rms",
+            f"Switch: {rating('switch_voltage'):.1f} V, {rating('switch_current_peak'):.2f} A peak, "
+            f"{rating('switch_current_rms'):.2f} A rms, {rating('switch_current_avg'):.2f} A avg",
+            f"Diode: {rating('diode_voltage'):.1f} V, {rating('diode_current_peak'):.2f} A peak, "
+            f"{rating('diode_current_rms'):.2f} A rms, {rating('diode_current_avg'):.2f} A avg"
+        ]
+        if worst:
+            lines.append(f"Current Ripple: {abs(rating('current_ripple')):.3f} A")
+            lines.append(f"Voltage Ripple: {abs(rating('voltage_ripple'))*1e3:.2f} mV")
+            lines.append("Limiting corners:")
+            for key, label in (("inductor_current_peak", "Inductor peak"), ("switch_current_rms", "Switch RMS"),
+                               ("diode_current_avg", "Diode avg"), ("output_cap_current_rms", "Output cap RMS"),
+                               ("switch_voltage", "Switch voltage"), ("current_ripple", "Current ripple"),
+                               ("voltage_ripple", "Voltage ripple")):
+                lines.append(f"  {label}: {self.format_corner(worst[key], params)}")
+            analysis = design["worst_case"]
+            if analysis["excluded"]:
+                lines.append(f"Excluded: {analysis['excluded']} of {analysis['points']} corner/grid points "
+                             "(duty cycle out of range or invalid results)")
+            else:
+                lines.append(f"All {analysis['points']} corner/grid points feasible")
+        return lines
+
+    def format_corner(self, result, params):
+        labels = {"vin": ("Vin", "V", 1), "vout": ("Vout", "V", 1), "iout": ("Iout", "A", 1),
+                  "fsw": ("fsw", "kHz", 1e-3), "efficiency": ("η", "", 1), "turns_ratio": ("n", "", 1)}
+        parts = []
+        for name, value in result["point"].items():
+            if np.isclose(value, params[name]):
+                continue
+            if name in labels:
+                label, unit, scale = labels[name]
+                parts.append(f"{label}={value*scale:.4g} {unit}".rstrip())
+            else:
+                parts.append(f"{'L' if name == 'inductor' else 'C'} {(value/params[name]-1)*100:+.0f}%")
+        where = ", ".join(parts) if parts else "nominal"
+        return where if result["corner"] else f"{where} (interior)"
+
+    def display_sensitivities(self):
+        self.sensitivity_tree.delete(*self.sensitivity_tree.get_children())
+        if not self.current_design:
+            return
+        rows = rank_sensitivities(self.current_design["type"], self.current_design["parameters"])
+        for output, name, dydx, s in rows:
+            self.sensitivity_tree.insert("", tk.END, values=(output, name, f"{dydx:.3g}", f"{s:+.2f}"))
+
     def update_graphs(self):
-        """ EXACTLY THE SAME GRAPHING CODE FROM ORIGINAL IMPLEMENTATION """
+        """Redraw the waveform plots for the current design."""
         if not self.current_design:
             return
             
@@ -451,26 +1650,8 @@ class DCDCConverterDesigner:
             # Inductor current waveform
             ax2 = self.figure.add_subplot(222) if graph_mode == "all" else self.figure.add_subplot(111)
             
-            # Create realistic inductor current waveform
-            il_wave = np.zeros_like(t)
-            for i in range(len(t)):
-                phase = t[i] % period
-                if phase < params["duty_cycle"] * period:  # Switch ON
-                    if conv_type == "Buck":
-                        slope = (params['vin'] - params['vout']) / params['inductor']
-                    elif conv_type == "Boost":
-                        slope = params['vin'] / params['inductor']
-                    elif conv_type == "Buck-Boost":
-                        slope = params['vin'] / params['inductor']
-                    il_wave[i] = params['inductor_current_avg'] - params['current_ripple']/2 + slope * phase
-                else:  # Switch OFF
-                    if conv_type == "Buck":
-                        slope = -params['vout'] / params['inductor']
-                    elif conv_type == "Boost":
-                        slope = (params['vin'] - params['vout']) / params['inductor']
-                    elif conv_type == "Buck-Boost":
-                        slope = -params['vout'] / params['inductor']
-                    il_wave[i] = params['inductor_current_peak'] + slope * (phase - params['duty_cycle'] * period)
+            # Piecewise-linear inductor current from the topology's waveform kernel
+            il_wave = get_topology(conv_type).waveforms(params, t)["inductor_current"]
             
             ax2.plot(t*1e6, il_wave, 'r-')
             ax2.set_title('Inductor Current')
@@ -520,17 +1701,132 @@ class DCDCConverterDesigner:
         self.figure.tight_layout()
         self.canvas.draw()
         
+    def add_to_comparison(self):
+        if not self.current_design:
+            messagebox.showwarning("Warning", "No design to compare. Please calculate first.")
+            return
+        design = copy.deepcopy(self.current_design)
+        if self.workspace_window and self.workspace_window.exists():
+            self.workspace_window.add(design)
+        else:
+            self.workspace.append(design)
+            self.open_comparison()
+
+    def open_comparison(self):
+        if self.workspace_window and self.workspace_window.exists():
+            self.workspace_window.window.lift()
+            return
+        self.workspace_window = ComparisonWorkspace(self.root, self.workspace)
+
+    def clear_result_cache(self):
+        cache = get_result_cache()
+        cache.clear()
+        messagebox.showinfo("Result Cache", f"Cleared cached results in:\n{cache.directory}")
+
+    def open_magnetics_designer(self):
+        if not self.current_design:
+            messagebox.showwarning("Warning", "No design to size magnetics for. Please calculate first.")
+            return
+        conv_type = self.current_design["type"]
+        if not get_topology(conv_type).single_inductor:
+            messagebox.showinfo("Magnetics Designer",
+                                f"The magnetics designer sizes single-winding inductors only.\n"
+                                f"{conv_type} needs a coupled winding or a second inductor, which it does not model.")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title("Magnetics Designer")
+        window.geometry("900x420")
+
+        # Search limits
+        limits_frame = ttk.LabelFrame(window, text="Limits", padding=10)
+        limits_frame.pack(fill="x", padx=10, pady=5)
+        limits = {
+            "bsat_margin": ("Bsat Margin", "%", "20"),
+            "fill_factor": ("Window Fill", "%", "40"),
+            "j_max": ("Max Current Density", "A/mm²", "6"),
+            "loss_limit": ("Max Loss", "W", ""),
+        }
+        limit_entries = {}
+        for col, (key, (label, unit, default)) in enumerate(limits.items()):
+            ttk.Label(limits_frame, text=label + ":").grid(row=0, column=3*col, sticky="e", padx=2)
+            limit_entries[key] = ttk.Entry(limits_frame, width=6)
+            limit_entries[key].insert(0, default)
+            limit_entries[key].grid(row=0, column=3*col+1, sticky="w")
+            ttk.Label(limits_frame, text=unit).grid(row=0, column=3*col+2, sticky="w", padx=(2, 10))
+
+        summary = ttk.Label(window, text="")
+        summary.pack(fill="x", padx=10)
+
+        columns = ("core", "turns", "wire", "inductance", "b_peak", "fill", "core_loss", "copper_loss", "total_loss")
+        headings = ("Core", "N", "Wire", "L (µH)", "Bpk (mT)", "Fill (%)", "Pcore (mW)", "Pcu (mW)", "Ptotal (mW)")
+        tree = ttk.Treeview(window, columns=columns, show="headings", height=12)
+        for col, heading in zip(columns, headings):
+            tree.heading(col, text=heading)
+            tree.column(col, width=130 if col == "core" else 80, anchor="w" if col in ("core", "wire") else "e")
+        tree.pack(fill="both", expand=True, padx=10, pady=5)
+
+        def search():
+            params = self.current_design["parameters"]
+            worst = self.current_design.get("worst_case", {}).get("ratings", {})
+
+            def rating(key):
+                return worst[key]["value"] if key in worst else params[key]
+
+            try:
+                loss_text = limit_entries["loss_limit"].get().strip()
+                options = {
+                    "bsat_margin": float(limit_entries["bsat_margin"].get()) / 100,
+                    "fill_factor": float(limit_entries["fill_factor"].get()) / 100,
+                    "j_max": float(limit_entries["j_max"].get()) * 1e6,
+                    "loss_limit": float(loss_text) if loss_text else np.inf,
+                }
+            except ValueError:
+                messagebox.showerror("Input Error", "Limits must be numbers", parent=window)
+                return
+
+            i_peak = rating("inductor_current_peak")
+            i_rms = rating("inductor_current_rms")
+            delta_i = abs(rating("current_ripple"))
+            inputs = {"l": params["inductor"], "i_peak": i_peak, "i_rms": i_rms, "delta_i": delta_i,
+                      "fsw": params["fsw"], "database": get_core_database().fingerprint, **options}
+            results = get_result_cache().memoize(
+                "magnetics", inputs,
+                lambda: design_magnetics(params["inductor"], i_peak, i_rms, delta_i, params["fsw"], **options))
+
+            summary.config(text=f"L = {params['inductor']*1e6:.2f} µH, I peak = {i_peak:.2f} A, "
+                                f"I rms = {i_rms:.2f} A, ΔI = {delta_i:.3f} A — {len(results)} best feasible designs")
+            tree.delete(*tree.get_children())
+            for r in results:
+                tree.insert("", tk.END, values=(
+                    f"{r['core']} ({r['material']})", r["turns"], f"{r['strands']}×AWG{r['awg']}",
+                    f"{r['inductance']*1e6:.2f}", f"{r['b_peak']*1e3:.0f}", f"{r['fill']*100:.0f}",
+                    f"{r['core_loss']*1e3:.1f}", f"{r['copper_loss']*1e3:.1f}", f"{r['total_loss']*1e3:.1f}"))
+            if not results:
+                messagebox.showinfo("Magnetics Designer", "No feasible core/turns/wire combination found.", parent=window)
+
+        ttk.Button(limits_frame, text="Search", command=search).grid(row=0, column=3*len(limits), padx=10)
+        search()
+
     def new_design(self):
         # Reset all fields
         self.converter_type.current(0)
         for key in self.entries:
+            self.entries[key].config(state="normal")
             self.entries[key].delete(0, tk.END)
             self.entries[key].insert(0, self.params[key]["default"] if key in self.params else "")
+        self.update_turns_ratio_state()
+        for min_entry, max_entry in self.range_entries.values():
+            min_entry.delete(0, tk.END)
+            max_entry.delete(0, tk.END)
+        self.l_tol_entry.delete(0, tk.END)
+        self.c_tol_entry.delete(0, tk.END)
             
         self.inductor_value.config(text="")
         self.capacitor_value.config(text="")
         self.results_text.delete(1.0, tk.END)
         self.ratings_text.delete(1.0, tk.END)
+        self.sensitivity_tree.delete(*self.sensitivity_tree.get_children())
         self.figure.clear()
         self.canvas.draw()
         self.current_design = {}
@@ -548,6 +1844,7 @@ class DCDCConverterDesigner:
                     
                 # Update UI with loaded data
                 self.converter_type.set(data["type"])
+                self.update_turns_ratio_state()
                 for key in self.entries:
                     if key in data["parameters"]:
                         self.entries[key].delete(0, tk.END)
@@ -663,7 +1960,7 @@ class DCDCConverterDesigner:
                     ("Duty Cycle", f"{params['duty_cycle']:.3f}"),
                     ("Inductor (L)", f"{params['inductor']*1e6:.2f} µH"),
                     ("Capacitor (C)", f"{params['capacitor']*1e6:.2f} µF"),
-                    ("Voltage Ripple", f"{params['voltage_ripple']/params['vout']*100:.2f}%"),
+                    ("Voltage Ripple", f"{params['voltage_ripple']/abs(params['vout'])*100:.2f}%"),
                     ("Current Ripple", f"{params['current_ripple']/params['inductor_current_avg']*100:.1f}%")
                 ]
                 col1_x = x + 0.2*inch
@@ -731,23 +2028,19 @@ class DCDCConverterDesigner:
             y -= 0.18 * inch
             c.drawString(x, y, f"Capacitor Value: {params['capacitor']*1e6:.2f} µF")
             y -= 0.18 * inch
-            c.drawString(x, y, f"Voltage Ripple: {params['voltage_ripple']/params['vout']*100:.2f}%")
+            c.drawString(x, y, f"Voltage Ripple: {params['voltage_ripple']/abs(params['vout'])*100:.2f}%")
             y -= 0.18 * inch
             c.drawString(x, y, f"Current Ripple: {params['current_ripple']/params['inductor_current_avg']*100:.1f}%")
             y -= 0.3 * inch
 
             c.setFont("Helvetica-Bold", 12)
-            c.drawString(x, y, "Component Ratings:")
+            c.drawString(x, y, "Component Ratings (worst case):" if "worst_case" in design else "Component Ratings:")
             y -= 0.22 * inch
             c.setFont("Helvetica", 11)
-            c.drawString(x, y, f"Inductor: {params['inductor']*1e6:.2f} µH, {params['inductor_current_peak']:.2f} A peak")
-            y -= 0.18 * inch
-            c.drawString(x, y, f"Capacitor: {params['capacitor']*1e6:.2f} µF, {params['vout']:.1f} V")
-            y -= 0.18 * inch
-            c.drawString(x, y, f"Switch: {params['vin']:.1f} V, {params['switch_current_peak']:.2f} A")
-            y -= 0.18 * inch
-            c.drawString(x, y, f"Diode: {max(params['vin'], abs(params['vout'])):.1f} V, {params['diode_current_peak']:.2f} A")
-            y -= 0.3 * inch
+            for line in self.component_ratings():
+                c.drawString(x, y, line)
+                y -= 0.18 * inch
+            y -= 0.12 * inch
 
             # Add more details to the report
             y -= 0.1 * inch
@@ -779,7 +2072,7 @@ class DCDCConverterDesigner:
     def show_help(self):
         help_text = """DC-DC Converter Designer Help
 
-1. Select converter type (Buck, Boost, Buck-Boost)
+1. Select converter type (Buck, Boost, Buck-Boost, SEPIC, Ćuk, Flyback, Forward)
 2. Enter your design parameters
 3. Click Calculate to compute component values
 4. View results and waveforms